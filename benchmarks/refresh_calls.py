@@ -0,0 +1,59 @@
+import sys, os, platform, tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication, QRadioButton, QCheckBox, QPushButton, QGroupBox, QComboBox, QLabel, QMessageBox
+import main
+
+SETTERS = ("setStyleSheet", "setToolTip", "setEnabled", "setChecked", "clear", "addItems", "setCurrentText", "setCurrentIndex")
+calls = {}
+
+def count_setters(*classes):
+    def wrap(name, setter):
+        def counted(*args, **kwargs):
+            calls[name] = calls.get(name, 0) + 1
+            return setter(*args, **kwargs)
+        return counted
+    for cls in classes:
+        for name in SETTERS:
+            if hasattr(cls, name): setattr(cls, name, wrap(name, getattr(cls, name)))
+
+class NaiveViewState(main.ViewState):
+    def set(self, widget, **state):
+        for prop, value in state.items(): getattr(widget, self._props[prop][0])(value)
+
+def measure(name, refresh, rounds):
+    for mode, view in (("naive", NaiveViewState()), ("diffed", main.ViewState())):
+        main._view_state.flush()
+        main._view_state = view
+        calls.clear()
+        for _ in range(rounds):
+            refresh()
+            view.flush()
+        breakdown = "  ".join(f"{k}={v / rounds:.2f}" for k, v in sorted(calls.items()))
+        print(f"{name:<22} {mode:<6} {sum(calls.values()) / rounds:>7.2f} calls/refresh  {breakdown}")
+
+def run(rounds=100):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Portable mode keeps config.json/config.ini inside the temp dir instead of the repo or %APPDATA%
+        (Path(temp_dir) / "ExplorerBlurMica.dll").touch()
+        sys.frozen, sys.executable = True, str(Path(temp_dir) / "Mica4U.exe")
+        if sys.platform != "win32": platform.version = lambda: "10.0.22631"
+        app = QApplication(sys.argv)
+        QMessageBox.question = lambda *args: QMessageBox.StandardButton.Yes
+        QMessageBox.information = lambda *args: QMessageBox.StandardButton.Ok
+        count_setters(QRadioButton, QCheckBox, QPushButton, QGroupBox, QComboBox, QLabel)
+        window = main.MainWindow()
+        dialog = main.SettingsDialog(window.config, window)
+        effects, options, presets = (window.get_component(n) for n in ("effects_group", "options_group", "presets_colors_group"))
+        measure("refresh_effects", effects.refresh_effects, rounds)
+        measure("refresh_options", options.refresh_options, rounds)
+        measure("update_color_preview", presets.update_color_preview, rounds)
+        measure("reset_settings", dialog.reset_settings, rounds)
+        measure("toggle showUnsupported", lambda: dialog.unsupported_changed(window.config.get_value("gui", "showUnsupported", "false") == "false"), rounds)
+        window.config._save_timer.stop()
+        window.close()
+        app.quit()
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
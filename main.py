@@ -3,6 +3,7 @@ from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QRadioButton, QCheckBox, QLabel, QPushButton, QComboBox, QGridLayout, QDialog, QMessageBox, QInputDialog, QButtonGroup, QColorDialog, QSizePolicy, QFormLayout)
 from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QMargins, QObject, QUrl
 from PyQt6.QtGui import QIcon, QDesktopServices, QColor, QPixmap, QPalette
+from PyQt6 import sip
 
 CONSTANTS = {"VERSION": "1.7.3"}
 
@@ -65,6 +66,39 @@ def create_icon_button(text="", icon=None, tooltip=None, callback=None, min_widt
     if callback: btn.clicked.connect(callback)
     return btn
 
+class ViewState:
+    _props = {
+        "enabled": ("setEnabled", lambda w: not w.testAttribute(Qt.WidgetAttribute.WA_ForceDisabled)),
+        "checked": ("setChecked", lambda w: w.isChecked()),
+        "tooltip": ("setToolTip", lambda w: w.toolTip()),
+        "style": ("setStyleSheet", lambda w: w.styleSheet()),
+    }
+
+    def __init__(self):
+        self._pending = {}
+        self._timer = None
+
+    def set(self, widget, **state):
+        self._pending.setdefault(widget, {}).update(state)
+        if not self._timer:
+            self._timer = QTimer(singleShot=True, interval=0)
+            self._timer.timeout.connect(self.flush)
+        if not self._timer.isActive(): self._timer.start()
+
+    def flush(self):
+        pending, self._pending = self._pending, {}
+        for widget, state in pending.items():
+            if sip.isdeleted(widget): continue
+            blocked = widget.blockSignals(True)
+            try:
+                for prop, value in state.items():
+                    setter, getter = self._props[prop]
+                    if getter(widget) != value: getattr(widget, setter)(value)
+            finally:
+                widget.blockSignals(blocked)
+
+_view_state = ViewState()
+
 class ConfigManager:
     def __init__(self):
         self.base_path = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).parent
@@ -175,6 +209,7 @@ class EffectGroup(BaseGroup):
 
     def __init__(self, config):
         self.radio_buttons = {}
+        self.tooltips = {}
         self.button_group = QButtonGroup(exclusive=True)
         super().__init__("Effects", config)
 
@@ -185,8 +220,8 @@ class EffectGroup(BaseGroup):
             radio = QRadioButton(name)
             radio.setChecked(self.config.get_value("config", "effect") == key)
             radio.clicked.connect(lambda _, k=key: self.on_effect_changed(k))
-            radio.setToolTip(tooltip)
             self.radio_buttons[key] = radio
+            self.tooltips[key] = tooltip
             self.button_group.addButton(radio)
             grid.addWidget(radio, i // 2, i % 2)
         self.layout().addLayout(grid)
@@ -197,12 +232,10 @@ class EffectGroup(BaseGroup):
         current_effect = self.config.get_value("config", "effect", "1")
         for key, radio in self.radio_buttons.items():
             is_supported = check_compatibility(self.config, key, effect_support[key])
-            radio.setEnabled(is_supported)
-            radio.setToolTip(f"{radio.toolTip().split(' (')[0]}{' (Incompatible)' if not is_supported else ''}")
-            radio.setStyleSheet("QRadioButton:disabled {color: #808080;}")
+            _view_state.set(radio, enabled=is_supported, tooltip=f"{self.tooltips[key]}{' (Incompatible)' if not is_supported else ''}", style="QRadioButton:disabled {color: #808080;}")
             if not is_supported and key == current_effect:
-                radio.setChecked(False)
-                self.radio_buttons["1"].setChecked(True)
+                _view_state.set(radio, checked=False)
+                _view_state.set(self.radio_buttons["1"], checked=True)
                 self.config.set_value("config", "effect", "1")
                 self.on_effect_changed("1")
 
@@ -213,11 +246,12 @@ class EffectGroup(BaseGroup):
     def refresh_from_config(self):
         effect = self.config.get_value("config", "effect", "1")
         for key, radio in self.radio_buttons.items():
-            radio.setChecked(key == effect)
+            _view_state.set(radio, checked=key == effect)
 
 class OptionsGroup(BaseGroup):
     def __init__(self, config):
         self.checkboxes = {}
+        self.tooltips = {}
         super().__init__("Options", config)
 
     def init_ui(self):
@@ -229,6 +263,7 @@ class OptionsGroup(BaseGroup):
             cb.clicked.connect(lambda checked, k=key: self.config.set_value("config", k, str(checked).lower()))
             cb.setToolTip(tooltip)
             self.checkboxes[key] = cb
+            self.tooltips[key] = tooltip
             grid.addWidget(cb, idx % 2, idx // 2)
         self.layout().addLayout(grid)
         self.refresh_options()
@@ -236,15 +271,11 @@ class OptionsGroup(BaseGroup):
     def refresh_options(self):
         if winui_cb := self.checkboxes.get("clearWinUIBg"):
             is_supported = check_compatibility(self.config, "clearWinUIBg", lambda: gwv()[0] == 10 and gwv()[2] >= 22000)
-            winui_cb.setEnabled(is_supported)
-            winui_cb.setToolTip(f"{winui_cb.toolTip().split(' (')[0]}{' (Incompatible)' if not is_supported else ''}")
-            winui_cb.setStyleSheet("QCheckBox:disabled { color: #808080; }")
+            _view_state.set(winui_cb, enabled=is_supported, tooltip=f"{self.tooltips['clearWinUIBg']}{' (Incompatible)' if not is_supported else ''}", style="QCheckBox:disabled { color: #808080; }")
 
     def refresh_from_config(self):
         for key, checkbox in self.checkboxes.items():
-            checkbox.blockSignals(True)
-            checkbox.setChecked(self.config.get_value("config", key) == "true")
-            checkbox.blockSignals(False)
+            _view_state.set(checkbox, checked=self.config.get_value("config", key) == "true")
 
 class ColorPreview(QPushButton):
     colorSelected = pyqtSignal(int, int, int, int)
@@ -274,7 +305,7 @@ class ColorPreview(QPushButton):
             pass
 
     def update_color(self, r, g, b, a):
-        self.setStyleSheet(f"#colorPreview {{background-color: rgba({r}, {g}, {b}, {a});}}")
+        _view_state.set(self, style=f"#colorPreview {{background-color: rgba({r}, {g}, {b}, {a});}}")
         self.update_brush_icon((r, g, b))
 
     def update_brush_icon(self, rgb):
@@ -311,6 +342,7 @@ class PresetsColorsGroup(BaseGroup):
             layout.addWidget(btn, 0, i + 1)
         layout.addWidget(self.preview, 1, 0, 1, 3)
         self.layout().addLayout(layout)
+        self.tooltip_widgets = [self, *self.findChildren(QWidget)]
         self.update_color_preview()
 
     def on_preset_changed(self, name):
@@ -347,10 +379,10 @@ class PresetsColorsGroup(BaseGroup):
         effect_key = self.config.get_value("config", "effect", "1")
         is_supported = effect_key not in ("2", "4")
         r, g, b, a = tuple(int(self.config.get_value("light", k)) for k in ("r", "g", "b", "a"))
-        self.setEnabled(is_supported)
-        self.setToolTip("" if is_supported else "Color selection not supported for Mica effects.")
-        for child in self.findChildren(QWidget): child.setToolTip(self.toolTip())
-        self.preview.setEnabled(is_supported)
+        tooltip = "" if is_supported else "Color selection not supported for Mica effects."
+        for widget in self.tooltip_widgets: _view_state.set(widget, tooltip=tooltip)
+        _view_state.set(self, enabled=is_supported)
+        _view_state.set(self.preview, enabled=is_supported)
         self.preview.update_color(r, g, b, a if is_supported else int(a * 0.5))
 
     def on_effect_changed(self, _):
@@ -591,6 +623,7 @@ class MainWindow(QMainWindow):
         layout.addLayout(action_layout)
         self.setFixedSize(250, 300)
         self.load_selected_effect()
+        _view_state.flush()
 
     def get_component(self, name):
         if name not in self._ui_components:
@@ -600,7 +633,7 @@ class MainWindow(QMainWindow):
     def load_selected_effect(self):
         effect = self.config.get_value("config", "effect", "1")
         if effect in self.get_component("effects_group").radio_buttons:
-            self.get_component("effects_group").radio_buttons[effect].setChecked(True)
+            _view_state.set(self.get_component("effects_group").radio_buttons[effect], checked=True)
 
     def start_background_tasks(self):
         if not self._dll_status_thread: